@@ -0,0 +1,105 @@
+# --- Imports ---
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from domain.ocr import BENCHMARK_DIR, BENCHMARK_LABELS
+from domain.players import PLAYERS
+from utils.ocr import (
+    decode_image,
+    preprocess_image,
+    guess_player_name,
+)
+from utils.ocr_engines import create_engine
+
+
+# --- Parameters ---
+# (name, preprocess, engine name, engine kwargs)
+CONFIGS = [
+    ("easyocr raw", False, "easyocr", {"params": {}}),
+    ("easyocr preprocessed", True, "easyocr", {}),
+    ("tesseract preprocessed", True, "tesseract", {}),
+    ("onnx preprocessed", True, "onnx", {}),
+]
+
+
+# --- Functions ---
+def load_benchmark():
+    """Load benchmark images and expected player names.
+
+    Returns:
+        list: (image path, expected player name or None) tuples.
+    """
+    with open(BENCHMARK_LABELS, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    return [
+        (Path(BENCHMARK_DIR) / row["image"], row["player_name"] or None)
+        for row in rows
+    ]
+
+
+def run_config(samples, preprocess, engine):
+    """OCR every sample with one configuration.
+
+    Args:
+        samples (list): (image path, expected player name) tuples.
+        preprocess (bool): Apply preprocess_image before OCR.
+        engine (OcrEngine): OCR engine.
+
+    Returns:
+        tuple: (latencies in ms, hits, expected names count)
+    """
+    latencies = []
+    hits = 0
+    expected_count = 0
+
+    for path, expected in samples:
+        image = decode_image(path.read_bytes())
+        if image is None:
+            continue
+
+        start = time.perf_counter()
+        if preprocess:
+            image = preprocess_image(image)
+        texts = engine.read(image)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        detected = None
+        for txt in texts:
+            detected = guess_player_name(txt, PLAYERS)
+            if detected:
+                break
+
+        if expected:
+            expected_count += 1
+            hits += detected == expected
+
+    return latencies, hits, expected_count
+
+
+# --- Running benchmark ---
+if __name__ == "__main__":
+    samples = load_benchmark()
+    print(f"{len(samples)} benchmark images")
+
+    for name, preprocess, engine_name, engine_kwargs in CONFIGS:
+        try:
+            engine = create_engine(engine_name, **engine_kwargs)
+        except (ImportError, OSError) as e:
+            print(f"{name}: engine unavailable ({e})")
+            continue
+
+        latencies, hits, expected_count = run_config(samples, preprocess, engine)
+        if not latencies:
+            print(f"{name}: no image decoded")
+            continue
+        recall = hits / expected_count if expected_count else 0
+        print(
+            f"{name}: "
+            f"mean {np.mean(latencies):.0f}ms, "
+            f"p95 {np.percentile(latencies, 95):.0f}ms, "
+            f"recall {hits}/{expected_count} ({recall:.0%})"
+        )
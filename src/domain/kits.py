@@ -1,7 +1,44 @@
-SPONSOR_WORDS = ["fly", "emirates", "adidas", "puma", "nike", "climalite", "aeroready"]
+SPONSOR_WORDS = [
+    "fly", "emirates", "sega", "dreamcast", "jvc",
+    "adidas", "puma", "nike", "climalite", "aeroready"
+]
 
 KIT_TYPE_KEYWORDS = {
     "home": ["domicile", "home"],
     "away": ["extérieur", "exterieur", "away"],
     "third": ["third", "3rd", "troisième", "troisieme"]
 }
+
+# Kit catalogue
+CLUB = "arsenal"
+CATALOGUE_FIRST_SEASON = 1994
+CATALOGUE_LAST_SEASON = 2025
+
+# (first season start year, last season start year, value)
+BRAND_ERAS = [
+    (1986, 1993, "adidas"),
+    (1994, 2013, "nike"),
+    (2014, 2018, "puma"),
+    (2019, 2025, "adidas"),
+]
+# O2 (2002-2006) is left out: the OCR allowlist has no digits, it cannot be read
+SPONSOR_ERAS = [
+    (1981, 1998, ["jvc"]),
+    (1999, 2001, ["dreamcast", "sega"]),
+    (2006, 2025, ["emirates", "fly"]),
+]
+
+# Dominant colours, None when not catalogued yet
+HOME_COLOURS = ["red", "white"]
+KIT_COLOURS = {
+    ("2005-2006", "home"): ["red"], # redcurrant, last Highbury season
+    ("2024-2025", "away"): ["black"],
+    ("2024-2025", "third"): ["green", "white"],
+    ("2023-2024", "away"): ["yellow"],
+    ("2023-2024", "third"): ["blue"],
+    ("2022-2023", "away"): ["black"],
+    ("2022-2023", "third"): ["pink"],
+    ("2019-2020", "away"): ["yellow"],
+    ("2012-2013", "away"): ["purple"],
+    ("2010-2011", "away"): ["yellow"],
+}
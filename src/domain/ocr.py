@@ -0,0 +1,46 @@
+# --- Imports ---
+import os
+
+
+# --- Parameters ---
+
+# Engine: "easyocr", "tesseract" or "onnx"
+OCR_ENGINE = os.getenv("OCR_ENGINE", "easyocr")
+OCR_LANGS = ["en"]
+
+# Preprocessing
+OCR_MAX_SIDE = 1024 # downscale so the longest side is at most this (None to disable)
+OCR_GRAYSCALE = True
+OCR_CLAHE = True
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
+
+# Recognition
+OCR_ALLOWLIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZ.-"
+
+# EasyOCR detection, tuned for big block letters on the back of shirts
+READTEXT_PARAMS = {
+    "allowlist": OCR_ALLOWLIST,
+    "decoder": "greedy",
+    "min_size": 20,
+    "text_threshold": 0.7,
+    "low_text": 0.4,
+    "link_threshold": 0.4,
+    "canvas_size": OCR_MAX_SIDE or 2560,
+    "mag_ratio": 1.0,
+    "width_ths": 0.7,
+}
+
+# Tesseract (page segmentation 11: sparse text)
+TESSERACT_CONFIG = f"--oem 1 --psm 11 -c tessedit_char_whitelist={OCR_ALLOWLIST}"
+
+# ONNX recognizer, exported from EasyOCR with utils.ocr_engines.export_easyocr_recognizer
+ONNX_MODEL_DIR = "./data/models"
+ONNX_RECOGNIZER_PATH = ONNX_MODEL_DIR + "/recognizer.onnx"
+ONNX_CHARSET_PATH = ONNX_MODEL_DIR + "/recognizer_charset.txt"
+ONNX_INPUT_HEIGHT = 64
+ONNX_MIN_TEXT_HEIGHT = 20 # px, smaller regions are ignored by the cv2 detector
+
+# Benchmark
+BENCHMARK_DIR = "./data/benchmark"
+BENCHMARK_LABELS = BENCHMARK_DIR + "/labels.csv" # columns: image, player_name
@@ -1,14 +1,47 @@
+# --- Imports ---
+import os
+
+
 # --- Parameters ---
 
 # Saved items db
 OUTPUT_DIR = "./data/output"
 SAVED_ITEMS_DB = OUTPUT_DIR + "/vinted.db"
 
+# Parquet snapshot of saved items (export_parquet.py)
+EXPORT_DIR = OUTPUT_DIR + "/parquet"
+
+# Per-shard dbs (--shard), merged into SAVED_ITEMS_DB by merge_shards.py
+SHARDS_DIR = OUTPUT_DIR + "/shards"
+
+# Session cookies, cached with the db
+COOKIES_DIR = OUTPUT_DIR + "/cookies"
+SESSION_REFRESH_MARGIN = 15 * 60 # seconds, refresh tokens expiring sooner
+
+# Recorded runs (--record / --replay)
+RUNS_DIR = "./data/runs"
+
 # Request parameters
 BASE_URL = "https://www.vinted.fr/catalog?"
 ORDER = "newest_first"
 MAX_RETRIES = 3
 BACKOFF_BASE = 2 
+MAX_BACKOFF = 30 # seconds, longer Retry-After makes the request fail
+RETRY_BUDGET = 6 # retries for the whole run
+FAILURE_THRESHOLD = 3 # consecutive failed attempts opening the circuit (= one query failing all its retries)
+
+# Resource governor, for small runners / containers
+MEMORY_BOUNDED = os.getenv("MEMORY_BOUNDED", "false").lower() == "true"
+TRACK_MEMORY = os.getenv("TRACK_MEMORY", "false").lower() == "true" # tracemalloc per stage, debug only
+DECODE_REDUCED = MEMORY_BOUNDED # decode JPEGs at 1/2, 1/4 or 1/8 scale when larger than needed
+
+# Executors
+# one OCR model (~0.5-1GB) per worker, raise OCR_WORKERS on large machines
+DEFAULT_OCR_WORKERS = 1 if MEMORY_BOUNDED else min(2, os.cpu_count() or 1)
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", DEFAULT_OCR_WORKERS)) # 0 -> OCR inline in the event loop
+DECODE_WORKERS = 1 if MEMORY_BOUNDED else 4
+MAX_PENDING_OCR = 2 * max(OCR_WORKERS, 1) # photos in flight (download + decode + OCR)
+MAX_DECODED_IMAGES = int(os.getenv("MAX_DECODED_IMAGES", 2 if MEMORY_BOUNDED else MAX_PENDING_OCR))
 
 # Query parameters
 SEARCH_TEXT = "maillot arsenal"
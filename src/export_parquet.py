@@ -0,0 +1,24 @@
+# --- Imports ---
+from utils.analytics import (
+    export_new_items,
+    load_snapshot,
+    hits_by,
+    price_distribution,
+)
+
+
+# --- Exporting new items ---
+print("Exporting new items...")
+exported = export_new_items()
+print(f"{exported} items exported.")
+
+
+# --- Summary ---
+df = load_snapshot()
+print(f"{len(df)} items in snapshot.")
+
+if not df.empty:
+    print("\nTop players / seasons / kit types:")
+    print(hits_by(df).head(10).to_string())
+    print("\nPrices:")
+    print(price_distribution(df).to_string())
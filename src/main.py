@@ -1,11 +1,10 @@
 # --- Imports ---
+import argparse
 import asyncio
 import random
 import os
-from pathlib import Path
 from urllib.parse import urlencode
 from vinted_api_kit import VintedApi
-from aiohttp import ClientError
 import sqlite3
 import traceback
 import sys
@@ -17,91 +16,168 @@ from domain.request import (
     ORDER,
     MAX_RETRIES,
     BACKOFF_BASE,
+    MAX_BACKOFF,
+    RETRY_BUDGET,
+    FAILURE_THRESHOLD,
+    OCR_WORKERS,
+    DECODE_WORKERS,
+    MAX_PENDING_OCR,
+    MAX_DECODED_IMAGES,
+    TRACK_MEMORY,
+    RUNS_DIR,
+    SHARDS_DIR,
+    COOKIES_DIR,
+    SESSION_REFRESH_MARGIN,
     SEARCH_TEXT,
     DESIRED_BRANDS,
     DESIRED_SIZES,
 )
+from utils.dedup import SeenIndex
+from utils.executor import PipelineExecutor, fetch_image
+from utils.recorder import RunRecorder, RunArchive, new_archive_path
+from utils.resources import StageMonitor
+from utils.resilience import ResiliencePolicy, CircuitOpenError
+from utils.session import SessionStore
+from utils.sharding import parse_shard, shard_queries
 from utils.scraper import filter_and_build_items
-from utils.sqlite import create_table, get_all_items, insert_into_sqlite
+from utils.sqlite import create_table, get_all_item_ids, insert_into_sqlite
 
 
 # --- Parameters ---
 
-# Saved items
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
 # Search parameters
 SEARCH_TEXTS_BRANDS = [SEARCH_TEXT] + [f"{SEARCH_TEXT} {b}" for b in DESIRED_BRANDS]
 
-# Environment
-RUNNING_IN_GITHUB = os.getenv("GITHUB_ACTIONS", "false").lower() == "true"
-PERSIST_COOKIES = not RUNNING_IN_GITHUB
-COOKIES_DIR = Path("./cookies") if PERSIST_COOKIES else None
-if COOKIES_DIR :
-    COOKIES_DIR.mkdir(parents=True, exist_ok=True)
-
-
-# --- Loading saved items db ---
-create_table()
-saved_items = get_all_items()
-saved_items_ids = {item["id"] for item in saved_items}
-
 
 # --- Functions ---
-async def main():
+async def main(record=False, replay=None, shard=None):
+    """Run the scraper.
+
+    Args:
+        record (bool): Record search payloads and photos to a run archive.
+        replay (str|None): Run archive to replay instead of querying Vinted,
+            nothing is saved to the db.
+        shard (tuple|None): (index, count) to only run this shard's queries
+            and save to a per-shard db.
+    """
+    recorder = None
     try:
         print("Running scraper...")
 
-        async with VintedApi(
-            locale="fr",
-            cookies_dir=COOKIES_DIR,
-            persist_cookies=PERSIST_COOKIES,
-        ) as vinted:
+        # Startup state lives here and not at module level: the OCR workers
+        # are spawned and re-import this script as __mp_main__
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        session_store = SessionStore(COOKIES_DIR, SESSION_REFRESH_MARGIN)
+        monitor = StageMonitor(enabled=TRACK_MEMORY)
+
+        # Loading saved items db
+        with monitor.stage("load saved ids"):
+            create_table()
+            saved_items_ids = SeenIndex(get_all_item_ids())
+
+        search_texts = SEARCH_TEXTS_BRANDS
+        db_path = SAVED_ITEMS_DB
+        if shard:
+            shard_index, shard_count = shard
+            search_texts = shard_queries(SEARCH_TEXTS_BRANDS, shard_index, shard_count)
+            os.makedirs(SHARDS_DIR, exist_ok=True)
+            db_path = f"{SHARDS_DIR}/vinted_shard_{shard_index}_of_{shard_count}.db"
+            create_table(db_path)
+            saved_items_ids.update(get_all_item_ids(db_path))
+            print(f"Shard {shard_index}/{shard_count}: {len(search_texts)} queries, saving to {db_path}")
+
+        archive = RunArchive(replay) if replay else None
+        if archive:
+            print(f"Replaying {replay}")
+            seen_ids = SeenIndex()
+            image_source = archive.fetch_image
+        elif record:
+            recorder = RunRecorder(new_archive_path(RUNS_DIR))
+            print(f"Recording to {recorder.path}")
+            seen_ids = saved_items_ids
+            image_source = recorder.fetch_image
+        else:
+            seen_ids = saved_items_ids
+            image_source = fetch_image
+
+        with PipelineExecutor(
+            OCR_WORKERS,
+            DECODE_WORKERS,
+            MAX_PENDING_OCR,
+            max_decoded=MAX_DECODED_IMAGES,
+            fetch_image=image_source,
+        ) as executor:
+
+            if archive:
+                api = archive
+            else:
+                session_store.prepare()
+                api = VintedApi(
+                    locale="fr",
+                    cookies_dir=session_store.cookies_dir,
+                    persist_cookies=True,
+                )
+            async with api as vinted:
+                if recorder:
+                    vinted = recorder.wrap_api(vinted)
             
-            for search_text in SEARCH_TEXTS_BRANDS:
-                params = {"search_text": search_text, "order": ORDER}
-                search_url = BASE_URL + urlencode(params, doseq=True)
+                policy = ResiliencePolicy(
+                    MAX_RETRIES, BACKOFF_BASE, MAX_BACKOFF, RETRY_BUDGET, FAILURE_THRESHOLD
+                )
 
-                # Sleeping
-                await asyncio.sleep(random.uniform(1.5, 3.0))
+                for search_text in search_texts:
+                    if policy.is_open:
+                        print(f"Circuit open - skipping {search_text}")
+                        continue
 
-                # Attempts with backoff in case of error
-                new_saved_items = []
-                for attempt in range(1, MAX_RETRIES + 1):
+                    params = {"search_text": search_text, "order": ORDER}
+                    search_url = BASE_URL + urlencode(params, doseq=True)
+
+                    # Sleeping
+                    if not archive:
+                        await asyncio.sleep(random.uniform(1.5, 3.0))
+
+                    # Fetching, with retries and circuit breaker
+                    new_saved_items = []
                     try:
-                        # Fetching
-                        print(f"Sending request to {search_url} (attempt {attempt})")
-                        items = await vinted.search_items(url=search_url)
+                        print(f"Sending request to {search_url}")
+                        with monitor.stage(f"fetch '{search_text}'"):
+                            items = await policy.call(vinted.search_items, url=search_url)
                         print(f"{len(items)} items fetched")
 
                         # Processing each item
-                        new_saved_items = filter_and_build_items(
-                            items,
-                            DESIRED_BRANDS,
-                            DESIRED_SIZES,
-                            saved_items_ids
-                        )
-                        break
-
-                    except ClientError as e:
-                        print(f"Client error: {e}")
-                        if attempt == MAX_RETRIES:
-                            print("Maximum retries for this search_text - stop.")
-                            break
-                        backoff = (BACKOFF_BASE ** attempt) + random.uniform(0, 1.0)
-                        print(f"Waiting before retry: {backoff:.1f}s")
-                        await asyncio.sleep(backoff)
-                    
+                        with monitor.stage(f"process '{search_text}'"):
+                            new_saved_items = await filter_and_build_items(
+                                items,
+                                DESIRED_BRANDS,
+                                DESIRED_SIZES,
+                                seen_ids,
+                                executor
+                            )
+                        # raw payloads are not needed anymore
+                        del items
+
+                    except CircuitOpenError as e:
+                        print(f"Skipped: {e}")
+
                     except Exception as e:
-                        print(f"Unexpected error: {e}")
-                        break
+                        print(f"Error for this search_text - stop: {e}")
                 
-                # Updating saved items db
-                if new_saved_items:
-                    for item in new_saved_items:
-                        insert_into_sqlite(item)
-                    print(f"{len(new_saved_items)} new items saved")
+                    # Updating saved items db
+                    if new_saved_items and archive:
+                        for item in new_saved_items:
+                            print(f"Match: {item['id']} {item['title']} ({item['player_name']})")
+                        print(f"{len(new_saved_items)} items matched (replay, not saved)")
+                    elif new_saved_items:
+                        for item in new_saved_items:
+                            insert_into_sqlite(item, db_path)
+                        print(f"{len(new_saved_items)} new items saved")
+
+                if not archive:
+                    session_store.save(api)
         
+        # after the executor shutdown, so the OCR workers are accounted for
+        monitor.report()
         print("Scraper finished.")
     
     except Exception as e:
@@ -109,7 +185,27 @@ async def main():
         traceback.print_exc()
         sys.exit(1)
 
+    finally:
+        if recorder:
+            recorder.close()
+
 
 # --- Running main ---
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Vinted kits scraper")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--record", action="store_true",
+        help=f"record search payloads and photos to {RUNS_DIR}"
+    )
+    mode.add_argument(
+        "--replay", metavar="ARCHIVE",
+        help="replay a recorded run offline, without saving"
+    )
+    parser.add_argument(
+        "--shard", metavar="INDEX/COUNT", type=parse_shard,
+        help=f"only run this shard's queries, saving to {SHARDS_DIR}"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(record=args.record, replay=args.replay, shard=args.shard))
@@ -0,0 +1,19 @@
+# --- Imports ---
+import os
+from pathlib import Path
+
+from domain.request import OUTPUT_DIR, SHARDS_DIR
+from utils.sqlite import merge_databases
+
+
+# --- Merging shard dbs ---
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+shard_paths = sorted(Path(SHARDS_DIR).glob("*.db"))
+
+if not shard_paths:
+    print("No shard db found, nothing to merge.")
+    exit(0)
+
+print(f"Merging {len(shard_paths)} shard dbs...")
+merged = merge_databases(shard_paths)
+print(f"{merged} new items merged.")
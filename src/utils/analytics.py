@@ -0,0 +1,156 @@
+# --- Imports ---
+import json
+import os
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from domain.request import SAVED_ITEMS_DB, EXPORT_DIR
+
+
+# --- Parameters ---
+STATE_FILE = EXPORT_DIR + "/_state.json"
+
+# Every part is written with this schema, so a batch where a column is all
+# None is not inferred as null. email_sent is left out: rows are exported
+# once and the flag changes after export (mark_email_sent).
+SNAPSHOT_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("title", pa.string()),
+    ("brand", pa.string()),
+    ("status", pa.string()),
+    ("size", pa.string()),
+    ("season", pa.string()),
+    ("kit_type", pa.string()),
+    ("player_name", pa.string()),
+    ("url", pa.string()),
+    ("price", pa.float64()),
+    ("url_photo", pa.string()),
+    ("date_added", pa.timestamp("us", tz="UTC")),
+])
+
+
+# --- Functions ---
+
+# Export
+def load_watermark():
+    """Last exported SQLite rowid.
+
+    Returns:
+        int: Rowid, 0 if nothing was exported yet.
+    """
+    if not os.path.exists(STATE_FILE):
+        return 0
+    with open(STATE_FILE) as f:
+        return json.load(f)["last_rowid"]
+
+
+def save_watermark(last_rowid):
+    """Store the last exported SQLite rowid.
+
+    Args:
+        last_rowid (int): Rowid.
+
+    Returns:
+        None
+    """
+    tmp_path = STATE_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"last_rowid": last_rowid}, f)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def export_new_items(db_path=SAVED_ITEMS_DB):
+    """Append saved items added since the last export to Parquet.
+
+    Rows are read by rowid above the watermark (saved_items is insert
+    only), so the db is never rescanned. Each export writes one file per
+    date_added day under EXPORT_DIR/date=YYYY-MM-DD/.
+
+    Args:
+        db_path (str): SQLite database path.
+
+    Returns:
+        int: Number of exported rows.
+    """
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    last_rowid = load_watermark()
+
+    # read-only, the scraper owns the db
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    df = pd.read_sql_query(
+        f"""
+        SELECT rowid AS _rowid, {", ".join(SNAPSHOT_SCHEMA.names)}
+        FROM saved_items
+        WHERE rowid > ?
+        ORDER BY rowid
+        """,
+        conn,
+        params=(last_rowid,),
+    )
+    conn.close()
+
+    if df.empty:
+        return 0
+
+    df["price"] = pd.to_numeric(df["price"], errors="coerce")
+    df["date_added"] = pd.to_datetime(df["date_added"], utc=True, errors="coerce")
+    date = df["date_added"].dt.strftime("%Y-%m-%d").fillna("unknown")
+
+    first, last = int(df["_rowid"].iloc[0]), int(df["_rowid"].iloc[-1])
+    for day, part in df.groupby(date):
+        part_dir = f"{EXPORT_DIR}/date={day}"
+        os.makedirs(part_dir, exist_ok=True)
+        table = pa.Table.from_pandas(
+            part.drop(columns="_rowid"), schema=SNAPSHOT_SCHEMA, preserve_index=False
+        )
+        pq.write_table(table, f"{part_dir}/part-{first:09d}-{last:09d}.parquet")
+
+    save_watermark(last)
+    return len(df)
+
+
+# Queries
+def load_snapshot(columns=None):
+    """Load the exported items as a DataFrame.
+
+    Args:
+        columns (list|None): Columns to read, None for all.
+
+    Returns:
+        pd.DataFrame: Items, with the date partition column.
+    """
+    if not os.path.isdir(EXPORT_DIR):
+        return pd.DataFrame(columns=columns)
+
+    return pd.read_parquet(EXPORT_DIR, columns=columns)
+
+
+def hits_by(df, keys=("player_name", "season", "kit_type")):
+    """Count items per group.
+
+    Args:
+        df (pd.DataFrame): Items.
+        keys (tuple): Grouping columns.
+
+    Returns:
+        pd.Series: Counts, descending.
+    """
+    return df.groupby(list(keys), dropna=False).size().sort_values(ascending=False)
+
+
+def price_distribution(df, by=None):
+    """Price summary statistics.
+
+    Args:
+        df (pd.DataFrame): Items.
+        by (str|list|None): Optional grouping columns.
+
+    Returns:
+        pd.DataFrame|pd.Series: count, mean, std, min, quartiles, max.
+    """
+    if by is None:
+        return df["price"].describe()
+    return df.groupby(by)["price"].describe()
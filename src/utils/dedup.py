@@ -0,0 +1,72 @@
+# --- Imports ---
+import numpy as np
+
+
+# --- Classes ---
+class SeenIndex:
+    """Set of listing IDs stored as a sorted int64 NumPy array.
+
+    8 bytes per ID instead of a Python str in a set, O(log n) membership.
+    Accepts IDs as int or numeric str, like the ones built from raw_data.
+    """
+
+    def __init__(self, ids=()):
+        """
+        Args:
+            ids (iterable): Listing IDs.
+        """
+        self.ids = np.empty(0, dtype=np.int64)
+        self.update(ids)
+
+    @staticmethod
+    def _to_int(item_id):
+        try:
+            return int(item_id)
+        except (TypeError, ValueError):
+            return None
+
+    def __contains__(self, item_id):
+        item_id = self._to_int(item_id)
+        if item_id is None:
+            return False
+
+        idx = np.searchsorted(self.ids, item_id)
+        return bool(idx < len(self.ids) and self.ids[idx] == item_id)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, item_id):
+        """Add one ID.
+
+        Args:
+            item_id (int|str): Listing ID.
+
+        Returns:
+            None
+        """
+        item_id = self._to_int(item_id)
+        if item_id is None or item_id in self:
+            return
+
+        idx = np.searchsorted(self.ids, item_id)
+        self.ids = np.insert(self.ids, idx, item_id)
+
+    def update(self, ids):
+        """Bulk add IDs.
+
+        Args:
+            ids (iterable): Listing IDs.
+
+        Returns:
+            None
+        """
+        new_ids = np.fromiter(
+            (i for i in map(self._to_int, ids) if i is not None),
+            dtype=np.int64,
+        )
+        if not len(new_ids):
+            return
+
+        # union1d sorts and removes duplicates
+        self.ids = np.union1d(self.ids, new_ids)
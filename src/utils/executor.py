@@ -0,0 +1,131 @@
+# --- Imports ---
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from domain.ocr import OCR_ENGINE
+from utils.ocr import (
+    init_engine,
+    download_image,
+    load_image,
+    load_colours,
+    read_texts,
+    find_player_name,
+    find_sponsors,
+)
+
+
+# --- Functions ---
+async def fetch_image(image_url):
+    """Download image bytes off the event loop.
+
+    Args:
+        image_url (str): URL of the image.
+
+    Returns:
+        bytes|None: Raw image bytes or None.
+    """
+    return await asyncio.to_thread(download_image, image_url)
+
+
+# --- Classes ---
+class PipelineExecutor:
+    """Hand off the CPU-bound extraction work from the event loop.
+
+    - OCR runs in a process pool, each worker holding a warm OCR engine
+      (or inline when ocr_workers is 0).
+    - Image decoding and preprocessing run in a thread pool (cv2 releases
+      the GIL), so only downscaled images are sent to the OCR workers.
+    - Regex/fuzzy matching stays inline, it is cheap.
+
+    At most max_pending photos are in flight at once (backpressure), and at
+    most max_decoded of them are held decoded in memory.
+    """
+
+    def __init__(
+        self,
+        ocr_workers,
+        decode_workers,
+        max_pending,
+        max_decoded=None,
+        fetch_image=fetch_image,
+    ):
+        """
+        Args:
+            ocr_workers (int): OCR worker processes, 0 to run OCR inline.
+            decode_workers (int): Decode threads.
+            max_pending (int): Max photos downloaded/decoded/OCR'd at once.
+            max_decoded (int|None): Max decoded images held at once,
+                defaults to max_pending.
+            fetch_image (callable): Async image downloader, replaced when
+                recording or replaying a run.
+        """
+        self.fetch_image = fetch_image
+        self.ocr_workers = ocr_workers
+        self.decode_pool = ThreadPoolExecutor(max_workers=decode_workers)
+        self.ocr_pool = None
+        if ocr_workers > 0:
+            # spawn: torch/onnxruntime are not fork-safe, workers load their own model
+            # split cores between workers to avoid oversubscription
+            engine_threads = max(1, (os.cpu_count() or 1) // ocr_workers)
+            self.ocr_pool = ProcessPoolExecutor(
+                max_workers=ocr_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_engine,
+                initargs=(OCR_ENGINE, engine_threads),
+            )
+        self.semaphore = asyncio.Semaphore(max_pending)
+        self.decoded_semaphore = asyncio.Semaphore(max_decoded or max_pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        """Shut down the pools.
+
+        Returns:
+            None
+        """
+        self.decode_pool.shutdown(wait=True)
+        if self.ocr_pool:
+            self.ocr_pool.shutdown(wait=True, cancel_futures=True)
+
+    async def read_photo(self, image_url, with_colours=False):
+        """Download, decode and OCR an image, off the event loop.
+
+        Args:
+            image_url (str): URL of the image.
+            with_colours (bool): Also get the dominant colours, from the
+                same downloaded bytes.
+
+        Returns:
+            tuple: (player name or None, sponsor words found, colour names)
+        """
+        loop = asyncio.get_running_loop()
+        colours = []
+
+        async with self.semaphore:
+            image_bytes = await self.fetch_image(image_url)
+            if image_bytes is None:
+                return None, [], colours
+
+            async with self.decoded_semaphore:
+                if with_colours:
+                    colours = await loop.run_in_executor(self.decode_pool, load_colours, image_bytes)
+                image = await loop.run_in_executor(self.decode_pool, load_image, image_bytes)
+                # release the encoded buffer as soon as it is decoded
+                del image_bytes
+                if image is None:
+                    return None, [], colours
+
+                if self.ocr_pool:
+                    texts = await loop.run_in_executor(self.ocr_pool, read_texts, image)
+                else:
+                    texts = read_texts(image)
+                del image
+
+        return find_player_name(texts, image_url), find_sponsors(texts), colours
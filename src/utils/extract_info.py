@@ -12,9 +12,9 @@ SEASON_REGEX = re.compile(
     r"""
     (?<!\d)
     (
-        (20\d{2})      # (2023)
-        [\-/ ]         # -, / space
-        (20\d{2}|\d{2}) # 2024 or 24
+        ((?:19|20)\d{2})             # 2023 or 1994
+        [\-/ ]                       # -, / space
+        ((?:19|20)\d{2}|\d{2})       # 2024, 1995 or 24
         |
         (\d{2})
         [\-/]
@@ -24,7 +24,7 @@ SEASON_REGEX = re.compile(
     """,
     re.VERBOSE
 )
-YEAR_REGEX = re.compile(r"\b(20\d{2})\b")
+YEAR_REGEX = re.compile(r"\b((?:19|20)\d{2})\b")
 
 # Kit types
 ALL_KIT_KEYWORDS = []
@@ -0,0 +1,178 @@
+# --- Imports ---
+from itertools import product
+
+from domain.kits import (
+    CLUB,
+    CATALOGUE_FIRST_SEASON,
+    CATALOGUE_LAST_SEASON,
+    BRAND_ERAS,
+    SPONSOR_ERAS,
+    HOME_COLOURS,
+    KIT_COLOURS,
+    KIT_TYPE_KEYWORDS,
+)
+
+
+# --- Parameters ---
+MIN_COLOUR_SCORE = 0.5 # share of the kit colours found in the photo
+
+
+# --- Functions ---
+def era_value(eras, year):
+    """Value of the era containing a season start year.
+
+    Args:
+        eras (list): (first year, last year, value) tuples.
+        year (int): Season start year.
+
+    Returns:
+        Any: Era value or None.
+    """
+    for first, last, value in eras:
+        if first <= year <= last:
+            return value
+    return None
+
+
+def build_catalogue(club=CLUB):
+    """Build the kit catalogue from the eras and colours in domain.kits.
+
+    Returns:
+        list: Kit dicts with club, season, kit_type, brand, sponsors, colours.
+    """
+    kits = []
+    for year in range(CATALOGUE_FIRST_SEASON, CATALOGUE_LAST_SEASON + 1):
+        season = f"{year}-{year + 1}"
+        for kit_type in KIT_TYPE_KEYWORDS:
+            colours = KIT_COLOURS.get((season, kit_type))
+            if colours is None and kit_type == "home":
+                colours = HOME_COLOURS
+            kits.append(
+                {
+                    "club": club,
+                    "season": season,
+                    "kit_type": kit_type,
+                    "brand": era_value(BRAND_ERAS, year),
+                    "sponsors": era_value(SPONSOR_ERAS, year) or [],
+                    "colours": colours,
+                }
+            )
+    return kits
+
+
+# --- Classes ---
+class KitCatalogue:
+    """Kits indexed by every combination of known (season, kit_type, brand).
+
+    Resolving an item is a single dict lookup on the signals it has, then a
+    score of the few candidates on colours and sponsors.
+    """
+
+    def __init__(self, kits):
+        """
+        Args:
+            kits (list): Kit dicts, see build_catalogue.
+        """
+        self.index = {}
+        self.sponsor_words = {word for kit in kits for word in kit["sponsors"]}
+        for kit in kits:
+            for season, kit_type, brand in product(
+                (kit["season"], None), (kit["kit_type"], None), (kit["brand"], None)
+            ):
+                key = (kit["club"], season, kit_type, brand)
+                self.index.setdefault(key, []).append(kit)
+
+    def candidates(self, season=None, kit_type=None, brand=None, club=CLUB):
+        """Kits matching the known signals.
+
+        Args:
+            season (str|None): Season like "2022-2023".
+            kit_type (str|None): "home", "away" or "third".
+            brand (str|None): Lowercased brand.
+            club (str): Club.
+
+        Returns:
+            list: Matching kit dicts.
+        """
+        return self.index.get((club, season, kit_type, brand), [])
+
+    @staticmethod
+    def contradicts(kit, sponsors):
+        """Whether the sponsor words read rule a kit out.
+
+        Args:
+            kit (dict): Kit.
+            sponsors (list): Shirt sponsor words read on the photos.
+
+        Returns:
+            bool: True if sponsors were read and none is the kit's.
+        """
+        return bool(sponsors) and not set(sponsors) & set(kit["sponsors"])
+
+    @staticmethod
+    def matches(kit, colours, sponsors):
+        """Whether a kit positively matches the photo signals.
+
+        Kits without catalogued colours never match: not knowing a kit's
+        colours is not evidence for it.
+
+        Args:
+            kit (dict): Kit.
+            colours (list): Dominant colours of the photo.
+            sponsors (list): Shirt sponsor words read on the photos.
+
+        Returns:
+            bool: True if the colours match and no sponsor contradicts.
+        """
+        if not colours or not kit["colours"]:
+            return False
+
+        if KitCatalogue.contradicts(kit, sponsors):
+            return False
+
+        score = len(set(kit["colours"]) & set(colours)) / len(kit["colours"])
+        return score >= MIN_COLOUR_SCORE
+
+    def resolve(self, season=None, kit_type=None, brand=None, colours=None, sponsors=None):
+        """Fill the missing season and kit type from the catalogue.
+
+        Only resolves when exactly one catalogued kit matches and every
+        other candidate is ruled out: e.g. a red photo matches every home
+        kit, and a white photo could be an uncatalogued away kit, so both
+        stay unresolved.
+
+        Args:
+            season (str|None): Season from the title.
+            kit_type (str|None): Kit type from the title.
+            brand (str|None): Lowercased brand_title.
+            colours (list|None): Dominant colours of the photo.
+            sponsors (list|None): Sponsor words read on the photos.
+
+        Returns:
+            tuple: (season, kit_type), unchanged when ambiguous.
+        """
+        if season and kit_type:
+            return season, kit_type
+
+        # OCR also reads kit makers (nike, adidas...), keep shirt sponsors only
+        sponsors = [word for word in sponsors or [] if word in self.sponsor_words]
+
+        # brands outside the catalogue (fakes, resellers...) are ignored
+        kits = self.candidates(season, kit_type, brand) or self.candidates(season, kit_type)
+
+        # an uncatalogued kit cannot be ruled out on colours
+        if any(
+            kit["colours"] is None and not self.contradicts(kit, sponsors)
+            for kit in kits
+        ):
+            return season, kit_type
+
+        matching = [kit for kit in kits if self.matches(kit, colours, sponsors)]
+        if len(matching) != 1:
+            return season, kit_type
+
+        return matching[0]["season"], matching[0]["kit_type"]
+
+
+# --- Catalogue ---
+CATALOGUE = KitCatalogue(build_catalogue())
@@ -1,22 +1,75 @@
 # --- Imports ---
+from io import BytesIO
+
 import requests
 from rapidfuzz import fuzz, process
 import cv2
 import numpy as np
-import easyocr
+from PIL import Image
 
 from .text import normalize
+from .ocr_engines import create_engine
 from domain.kits import SPONSOR_WORDS
+from domain.ocr import (
+    OCR_MAX_SIDE,
+    OCR_GRAYSCALE,
+    OCR_CLAHE,
+    CLAHE_CLIP_LIMIT,
+    CLAHE_TILE_GRID,
+    OCR_ENGINE,
+)
 from domain.players import PLAYERS
+from domain.request import DECODE_REDUCED
 
 
 # --- Parameters ---
-LANGS = ["en"]
-reader = easyocr.Reader(LANGS, verbose=False)
+engine = None # one per process, see init_engine
+
+# Colour names by HSV hue range (OpenCV hue is 0-179)
+HUE_COLOURS = [
+    (0, 8, "red"),
+    (8, 20, "orange"),
+    (20, 35, "yellow"),
+    (35, 85, "green"),
+    (85, 130, "blue"),
+    (130, 150, "purple"),
+    (150, 170, "pink"),
+    (170, 180, "red"),
+]
+MIN_COLOUR_SHARE = 0.15 # share of the photo centre for a dominant colour
+
+# cv2 flags decoding at a reduced scale, by (factor, grayscale)
+REDUCED_FLAGS = {
+    (1, False): cv2.IMREAD_COLOR,
+    (2, False): cv2.IMREAD_REDUCED_COLOR_2,
+    (4, False): cv2.IMREAD_REDUCED_COLOR_4,
+    (8, False): cv2.IMREAD_REDUCED_COLOR_8,
+    (1, True): cv2.IMREAD_GRAYSCALE,
+    (2, True): cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    (4, True): cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    (8, True): cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
 
 
 # --- Functions ---
 
+# Engine
+def init_engine(name=OCR_ENGINE, num_threads=None):
+    """Load the OCR engine in the current process.
+
+    Used as the process pool initializer so each worker keeps a warm model.
+
+    Args:
+        name (str): OCR engine name, see utils.ocr_engines.
+        num_threads (int|None): Engine threads for this process.
+
+    Returns:
+        None
+    """
+    global engine
+    engine = create_engine(name, num_threads=num_threads)
+
+
 # Player name
 def guess_player_name(ocr_text, players_list, threshold=85):
     """Guess player name from OCR text using fuzzy matching.
@@ -52,14 +105,15 @@ def guess_player_name(ocr_text, players_list, threshold=85):
     return match
 
 
-def extract_player_name_ocr(image_url: str):
-    """Extract player name from image URL using OCR.
-    
+# Image
+def download_image(image_url):
+    """Download image bytes.
+
     Args:
         image_url (str): URL of the image.
-    
+
     Returns:
-        str|None: Detected player name or None.
+        bytes|None: Raw image bytes or None.
     """
     try:
         response = requests.get(image_url, timeout=15)
@@ -68,28 +122,232 @@ def extract_player_name_ocr(image_url: str):
         print(f"Failed to download image: {e}")
         return None
 
+    return response.content
+
+
+def reduction_factor(image_bytes, max_side):
+    """Largest decode reduction keeping the longest side >= max_side.
+
+    Only the image header is read.
+
+    Args:
+        image_bytes (bytes): Raw image bytes.
+        max_side (int): Target max side in pixels.
+
+    Returns:
+        int: 1, 2, 4 or 8.
+    """
+    try:
+        with Image.open(BytesIO(image_bytes)) as img:
+            longest = max(img.size)
+    except Exception:
+        return 1
+
+    for factor in (8, 4, 2):
+        if longest / factor >= max_side:
+            return factor
+
+    return 1
+
+
+def decode_image(image_bytes, reduce_to=None, grayscale=False):
+    """Decode image bytes into a BGR (or grayscale) array.
+
+    Args:
+        image_bytes (bytes): Raw image bytes (jpeg, png, webp, etc.).
+        reduce_to (int|None): Decode at a reduced scale (cv2.IMREAD_REDUCED_*)
+            when the image is at least 2x this max side.
+        grayscale (bool): Decode straight to grayscale.
+
+    Returns:
+        np.ndarray|None: Decoded image or None.
+    """
+    if not image_bytes:
+        return None
+
     # Convert image bytes to numpy array
-    image_bytes = np.frombuffer(response.content, np.uint8)
+    buffer = np.frombuffer(image_bytes, np.uint8)
 
-    # Decode image (supports jpeg, png, webp, etc.)
-    image = cv2.imdecode(image_bytes, cv2.IMREAD_COLOR)
+    # Decode image
+    factor = reduction_factor(image_bytes, reduce_to) if reduce_to else 1
+    image = cv2.imdecode(buffer, REDUCED_FLAGS[(factor, grayscale)])
 
     if image is None:
         print("Failed to decode image")
+
+    return image
+
+
+# Preprocessing
+def downscale(image, max_side):
+    """Downscale image so its longest side is at most max_side.
+
+    Args:
+        image (np.ndarray): Image.
+        max_side (int): Target max side in pixels.
+
+    Returns:
+        np.ndarray: Resized image (unchanged if already small enough).
+    """
+    height, width = image.shape[:2]
+    scale = max_side / max(height, width)
+
+    if scale >= 1:
+        return image
+
+    size = (round(width * scale), round(height * scale))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def preprocess_image(
+    image,
+    max_side=OCR_MAX_SIDE,
+    grayscale=OCR_GRAYSCALE,
+    clahe=OCR_CLAHE,
+):
+    """Prepare a decoded image for OCR.
+
+    Args:
+        image (np.ndarray): Decoded BGR or grayscale image.
+        max_side (int|None): Target max side, None to keep full resolution.
+        grayscale (bool): Convert to grayscale.
+        clahe (bool): Apply CLAHE contrast equalization (grayscale only).
+
+    Returns:
+        np.ndarray: Preprocessed image.
+    """
+    if max_side:
+        image = downscale(image, max_side)
+
+    if not grayscale:
+        return image
+
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    if clahe:
+        equalizer = cv2.createCLAHE(clipLimit=CLAHE_CLIP_LIMIT, tileGridSize=CLAHE_TILE_GRID)
+        image = equalizer.apply(image)
+
+    return image
+
+
+def load_image(image_bytes):
+    """Decode and preprocess image bytes.
+
+    Args:
+        image_bytes (bytes): Raw image bytes.
+
+    Returns:
+        np.ndarray|None: Preprocessed image or None.
+    """
+    if DECODE_REDUCED:
+        image = decode_image(image_bytes, reduce_to=OCR_MAX_SIDE, grayscale=OCR_GRAYSCALE)
+    else:
+        image = decode_image(image_bytes)
+
+    if image is None:
         return None
 
-    # OCR
-    result = reader.readtext(image)
+    return preprocess_image(image)
+
 
-    extracted_texts = [text for (_, text, _) in result]
+# Colours
+def dominant_colours(image, min_share=MIN_COLOUR_SHARE):
+    """Cheap colour histogram of the centre of a photo.
 
-    # Try to find player name among detected texts
-    detected_player = None
+    Args:
+        image (np.ndarray): BGR image, can be heavily downscaled.
+        min_share (float): Min share of pixels for a colour to count.
+
+    Returns:
+        list: Colour names, most frequent first.
+    """
+    # the shirt is usually in the middle, skip the background
+    height, width = image.shape[:2]
+    centre = image[height // 4: 3 * height // 4, width // 4: 3 * width // 4]
+    hsv = cv2.cvtColor(centre, cv2.COLOR_BGR2HSV).reshape(-1, 3)
+    hue, sat, val = hsv[:, 0], hsv[:, 1].astype(int), hsv[:, 2].astype(int)
+
+    black = val < 50
+    white = ~black & (sat < 40) & (val > 180)
+    grey = ~black & ~white & (sat < 40)
+    chromatic = ~(black | white | grey)
+
+    counts = {"black": black.sum(), "white": white.sum(), "grey": grey.sum()}
+    for low, high, name in HUE_COLOURS:
+        counts[name] = counts.get(name, 0) + (chromatic & (hue >= low) & (hue < high)).sum()
+
+    total = max(len(hsv), 1)
+    return [
+        name for name, count in sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+        if count / total >= min_share
+    ]
+
+
+def load_colours(image_bytes):
+    """Decode image bytes at 1/8 scale and get its dominant colours.
+
+    Args:
+        image_bytes (bytes): Raw image bytes.
+
+    Returns:
+        list: Colour names, empty if the image cannot be decoded.
+    """
+    if not image_bytes:
+        return []
+
+    image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_REDUCED_COLOR_8)
+    if image is None:
+        return []
+
+    return dominant_colours(image)
+
+
+# OCR
+def read_texts(image):
+    """Run OCR on a decoded image.
+
+    Args:
+        image (np.ndarray): Decoded image.
+
+    Returns:
+        list: Extracted text strings.
+    """
+    if engine is None:
+        init_engine()
+
+    return engine.read(image)
+
+
+def find_player_name(extracted_texts, image_url):
+    """Find a player name among OCR texts.
+
+    Args:
+        extracted_texts (list): Extracted text strings.
+        image_url (str): URL of the image, for logging.
+
+    Returns:
+        str|None: Detected player name or None.
+    """
     for txt in extracted_texts:
         candidate = guess_player_name(txt, PLAYERS)
         if candidate:
             print(f"Image URL: {image_url}\nExtracted text: {txt} --> player: {candidate}")
-            detected_player = candidate
-            break
+            return candidate
+
+    return None
 
-    return detected_player
+
+def find_sponsors(extracted_texts):
+    """Find sponsor words among OCR texts.
+
+    Args:
+        extracted_texts (list): Extracted text strings.
+
+    Returns:
+        list: Sponsor words found.
+    """
+    # the OCR allowlist has no space: "Fly Emirates" is read as "FLYEMIRATES"
+    texts = [normalize(txt, input_type="player") for txt in extracted_texts]
+    return [word for word in SPONSOR_WORDS if any(word in txt for txt in texts)]
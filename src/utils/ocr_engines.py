@@ -0,0 +1,303 @@
+# --- Imports ---
+import os
+
+import cv2
+import numpy as np
+
+from domain.ocr import (
+    OCR_LANGS,
+    OCR_ALLOWLIST,
+    READTEXT_PARAMS,
+    TESSERACT_CONFIG,
+    ONNX_RECOGNIZER_PATH,
+    ONNX_CHARSET_PATH,
+    ONNX_INPUT_HEIGHT,
+    ONNX_MIN_TEXT_HEIGHT,
+)
+
+
+# --- Classes ---
+class OcrEngine:
+    """OCR backend interface.
+
+    Backends import their dependencies lazily so only the selected one has
+    to be installed.
+    """
+
+    name = None
+
+    def read(self, image):
+        """Read text from an image.
+
+        Args:
+            image (np.ndarray): Grayscale or BGR image.
+
+        Returns:
+            list: Extracted text strings.
+        """
+        raise NotImplementedError
+
+
+class EasyOcrEngine(OcrEngine):
+    """EasyOCR (CRAFT detector + CRNN recognizer, torch)."""
+
+    name = "easyocr"
+
+    def __init__(self, num_threads=None, params=READTEXT_PARAMS):
+        """
+        Args:
+            num_threads (int|None): Torch intra-op threads.
+            params (dict): Keyword arguments for reader.readtext.
+        """
+        import easyocr
+        import torch
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                # can only be set once per process
+                pass
+
+        # inference only, no autograd buffers
+        torch.set_grad_enabled(False)
+
+        self.params = params
+        self.reader = easyocr.Reader(OCR_LANGS, gpu=False, verbose=False)
+
+    def read(self, image):
+        result = self.reader.readtext(image, **self.params)
+        return [text for (_, text, _) in result]
+
+
+class TesseractEngine(OcrEngine):
+    """Tesseract through pytesseract, needs the tesseract binary."""
+
+    name = "tesseract"
+
+    def __init__(self, num_threads=None, config=TESSERACT_CONFIG):
+        """
+        Args:
+            num_threads (int|None): OpenMP threads used by tesseract.
+            config (str): Tesseract command line options.
+        """
+        import pytesseract
+
+        if num_threads:
+            os.environ["OMP_THREAD_LIMIT"] = str(num_threads)
+
+        self.pytesseract = pytesseract
+        self.config = config
+
+    def read(self, image):
+        text = self.pytesseract.image_to_string(image, config=self.config)
+        return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+class OnnxOcrEngine(OcrEngine):
+    """EasyOCR recognizer exported to ONNX, run with ONNX Runtime.
+
+    Text regions are found with a cheap cv2 detector (binarization +
+    morphology), which is enough for large shirt lettering and avoids
+    shipping the CRAFT detector.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        num_threads=None,
+        model_path=ONNX_RECOGNIZER_PATH,
+        charset_path=ONNX_CHARSET_PATH,
+    ):
+        """
+        Args:
+            num_threads (int|None): ONNX Runtime intra-op threads.
+            model_path (str): Exported recognizer.
+            charset_path (str): Recognizer character set, one line.
+        """
+        import onnxruntime as ort
+
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"{model_path} not found, run export_easyocr_recognizer first"
+            )
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            model_path, options, providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+        with open(charset_path, encoding="utf-8") as f:
+            # index 0 is the CTC blank
+            self.characters = [None] + list(f.read().rstrip("\n"))
+
+        self.allowed = [
+            i for i, c in enumerate(self.characters) if c is None or c in OCR_ALLOWLIST
+        ]
+
+    def detect(self, gray):
+        """Find text line boxes.
+
+        Args:
+            gray (np.ndarray): Grayscale image.
+
+        Returns:
+            list: (x, y, w, h) boxes, top to bottom.
+        """
+        boxes = []
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 3))
+
+        # dark on light and light on dark lettering
+        for flag in (cv2.THRESH_BINARY_INV, cv2.THRESH_BINARY):
+            _, thresh = cv2.threshold(gray, 0, 255, flag + cv2.THRESH_OTSU)
+            merged = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+            contours, _ = cv2.findContours(merged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            for contour in contours:
+                x, y, w, h = cv2.boundingRect(contour)
+                if h >= ONNX_MIN_TEXT_HEIGHT and w >= h:
+                    boxes.append((x, y, w, h))
+
+        return sorted(boxes, key=lambda box: box[1])
+
+    def recognize(self, crop):
+        """Recognize the text in one line crop.
+
+        Args:
+            crop (np.ndarray): Grayscale crop.
+
+        Returns:
+            str: Recognized text.
+        """
+        height, width = crop.shape[:2]
+        new_width = max(ONNX_INPUT_HEIGHT, round(width * ONNX_INPUT_HEIGHT / height))
+        crop = cv2.resize(crop, (new_width, ONNX_INPUT_HEIGHT), interpolation=cv2.INTER_AREA)
+
+        # same normalization as EasyOCR: [0, 255] -> [-1, 1]
+        tensor = (crop.astype(np.float32) / 255.0 - 0.5) / 0.5
+        tensor = tensor[np.newaxis, np.newaxis, :, :]
+
+        logits = self.session.run(None, {self.input_name: tensor})[0][0]
+
+        # greedy CTC decoding restricted to the allowlist
+        best = np.array(self.allowed)[logits[:, self.allowed].argmax(axis=1)]
+
+        chars = []
+        previous = 0
+        for idx in best:
+            if idx != previous and idx != 0:
+                chars.append(self.characters[idx])
+            previous = idx
+
+        return "".join(chars)
+
+    def read(self, image):
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        texts = []
+        for x, y, w, h in self.detect(gray):
+            text = self.recognize(gray[y:y + h, x:x + w])
+            if text:
+                texts.append(text)
+
+        return texts
+
+
+# --- Parameters ---
+ENGINES = {
+    engine.name: engine
+    for engine in (EasyOcrEngine, TesseractEngine, OnnxOcrEngine)
+}
+
+
+# --- Functions ---
+
+def create_engine(name, **kwargs):
+    """Instantiate an OCR engine by name.
+
+    Args:
+        name (str): "easyocr", "tesseract" or "onnx".
+        **kwargs: Engine constructor arguments.
+
+    Returns:
+        OcrEngine: The engine.
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown OCR engine: {name} (expected one of {list(ENGINES)})")
+
+    return ENGINES[name](**kwargs)
+
+
+def export_easyocr_recognizer(
+    model_path=ONNX_RECOGNIZER_PATH,
+    charset_path=ONNX_CHARSET_PATH,
+    atol=1e-3,
+):
+    """Export the EasyOCR recognizer to ONNX for OnnxOcrEngine.
+
+    Run once on a machine with easyocr/torch/onnxruntime installed, then
+    ship the model files with the cache. The exported model is checked
+    against the torch recognizer on a few input widths.
+
+    Args:
+        model_path (str): Output ONNX file.
+        charset_path (str): Output character set file.
+        atol (float): Max absolute difference allowed between the outputs.
+
+    Returns:
+        None
+    """
+    import easyocr
+    import onnxruntime as ort
+    import torch
+
+    # quantize=False: on CPU easyocr dynamically quantizes the recognizer
+    # by default, and quantized LSTM/Linear modules cannot be exported
+    reader = easyocr.Reader(OCR_LANGS, gpu=False, quantize=False, verbose=False)
+    recognizer = reader.recognizer.eval()
+
+    class Recognizer(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, image):
+            return self.model(image, None)
+
+    model = Recognizer(recognizer)
+
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    dummy = torch.randn(1, 1, ONNX_INPUT_HEIGHT, 256)
+    torch.onnx.export(
+        model,
+        dummy,
+        model_path,
+        input_names=["image"],
+        output_names=["logits"],
+        dynamic_axes={"image": {3: "width"}, "logits": {1: "steps"}},
+        opset_version=17,
+    )
+
+    # compare with the torch recognizer, including widths not seen at export
+    session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+    for width in (64, 256, 600):
+        sample = torch.rand(1, 1, ONNX_INPUT_HEIGHT, width) * 2 - 1
+        with torch.no_grad():
+            expected = model(sample).numpy()
+        actual = session.run(None, {"image": sample.numpy()})[0]
+        diff = float(np.abs(expected - actual).max())
+        if expected.shape != actual.shape or diff > atol:
+            raise RuntimeError(
+                f"ONNX recognizer differs from EasyOCR at width {width} "
+                f"(shapes {expected.shape}/{actual.shape}, max diff {diff:.2e})"
+            )
+
+    with open(charset_path, "w", encoding="utf-8") as f:
+        f.write(reader.character)
+
+    print(f"Recognizer exported to {model_path}")
@@ -0,0 +1,167 @@
+# --- Imports ---
+import base64
+import gzip
+import json
+import os
+import zlib
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from utils.executor import fetch_image
+
+
+# --- Functions ---
+def new_archive_path(runs_dir):
+    """Build the archive path for a new run.
+
+    Args:
+        runs_dir (str): Archives directory.
+
+    Returns:
+        str: Archive path, one per run.
+    """
+    os.makedirs(runs_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return f"{runs_dir}/run_{stamp}.jsonl.gz"
+
+
+# --- Classes ---
+class RunRecorder:
+    """Append search payloads and photo bytes to a gzipped JSON lines archive.
+
+    Records:
+        {"type": "search", "url": ..., "items": [raw_data, ...]}
+        {"type": "photo", "url": ..., "data": base64 bytes}
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Archive path.
+        """
+        self.path = path
+        self.file = gzip.open(path, "at", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def wrap_api(self, vinted):
+        """Wrap a VintedApi so search results get recorded.
+
+        Args:
+            vinted (VintedApi): Live API client.
+
+        Returns:
+            RecordingApi: Wrapped client.
+        """
+        return RecordingApi(vinted, self)
+
+    async def fetch_image(self, image_url):
+        """Download image bytes and record them.
+
+        Args:
+            image_url (str): URL of the image.
+
+        Returns:
+            bytes|None: Raw image bytes or None.
+        """
+        image_bytes = await fetch_image(image_url)
+        if image_bytes is not None:
+            self.write(
+                {
+                    "type": "photo",
+                    "url": image_url,
+                    "data": base64.b64encode(image_bytes).decode("ascii"),
+                }
+            )
+        return image_bytes
+
+
+class RecordingApi:
+    """VintedApi wrapper recording each search_items result."""
+
+    def __init__(self, vinted, recorder):
+        self.vinted = vinted
+        self.recorder = recorder
+
+    async def search_items(self, url, **kwargs):
+        items = await self.vinted.search_items(url=url, **kwargs)
+        self.recorder.write(
+            {
+                "type": "search",
+                "url": url,
+                "items": [item.raw_data for item in items],
+            }
+        )
+        return items
+
+
+class RunArchive:
+    """Recorded run, served back without network.
+
+    Exposes search_items like VintedApi and fetch_image like the live
+    downloader, so the same pipeline runs on it.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Archive path.
+        """
+        self.path = path
+        self.searches = {}
+        self.photos = {}
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    record = json.loads(line)
+                    if record["type"] == "search":
+                        self.searches.setdefault(record["url"], []).append(record["items"])
+                    elif record["type"] == "photo":
+                        self.photos[record["url"]] = base64.b64decode(record["data"])
+            # archive of an interrupted run, keep what was written
+            except (EOFError, gzip.BadGzipFile, zlib.error, json.JSONDecodeError):
+                print(f"Archive {path} is truncated, replaying the complete records")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def search_items(self, url, **kwargs):
+        """Return the next recorded result for this search URL.
+
+        Args:
+            url (str): Search URL.
+
+        Returns:
+            list: Items with a raw_data attribute (empty if not recorded).
+        """
+        results = self.searches.get(url)
+        if not results:
+            print(f"No recorded search for {url}")
+            return []
+        return [SimpleNamespace(raw_data=data) for data in results.pop(0)]
+
+    async def fetch_image(self, image_url):
+        """Return the recorded photo bytes.
+
+        Args:
+            image_url (str): URL of the image.
+
+        Returns:
+            bytes|None: Raw image bytes or None.
+        """
+        return self.photos.get(image_url)
@@ -0,0 +1,199 @@
+# --- Imports ---
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from aiohttp import ClientError, ClientResponseError
+from curl_cffi.requests.exceptions import RequestException
+
+
+# --- Parameters ---
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+BLOCKED_STATUSES = {403} # still rejected after vinted_api_kit re-bootstrapped the session
+
+
+# --- Classes ---
+class CircuitOpenError(Exception):
+    """Raised when requests are skipped because the circuit is open."""
+
+
+class ResiliencePolicy:
+    """Retry policy and circuit breaker shared by all the requests of a run.
+
+    - Retries network errors, 429 and 5xx with jittered exponential
+      backoff, scaled up by the error rate observed so far.
+    - Honours Retry-After, and gives up when it exceeds max_backoff.
+    - Caps the total number of retries of the run (retry budget).
+    - Opens the circuit after failure_threshold consecutive failed
+      attempts, across requests, or at once on 403, so the remaining
+      queries are skipped.
+    """
+
+    def __init__(
+        self,
+        max_retries,
+        backoff_base,
+        max_backoff,
+        retry_budget,
+        failure_threshold,
+    ):
+        """
+        Args:
+            max_retries (int): Max attempts per request.
+            backoff_base (float): Exponential backoff base, in seconds.
+            max_backoff (float): Max sleep before a retry, in seconds.
+            retry_budget (int): Max retries for the whole run.
+            failure_threshold (int): Consecutive failed attempts opening the circuit.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.retry_budget = retry_budget
+        self.failure_threshold = failure_threshold
+
+        self.consecutive_failures = 0
+        self.attempts = 0
+        self.errors = 0
+        self.is_open = False
+
+    @property
+    def error_rate(self):
+        return self.errors / self.attempts if self.attempts else 0.0
+
+    @staticmethod
+    def status_code(exc):
+        """HTTP status of a failed request, if any.
+
+        Args:
+            exc (Exception): Request error.
+
+        Returns:
+            int|None: Status code or None.
+        """
+        if isinstance(exc, ClientResponseError):
+            return exc.status
+
+        response = getattr(exc, "response", None)
+        return getattr(response, "status_code", None)
+
+    @staticmethod
+    def retry_after(exc):
+        """Parse the Retry-After header of a failed request.
+
+        Args:
+            exc (Exception): Request error.
+
+        Returns:
+            float|None: Seconds to wait or None.
+        """
+        if isinstance(exc, ClientResponseError):
+            headers = exc.headers or {}
+        else:
+            headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+    def is_retryable(self, exc):
+        """Whether a request error is worth retrying.
+
+        Args:
+            exc (Exception): Request error.
+
+        Returns:
+            bool: True for network errors, 429 and 5xx.
+        """
+        status = self.status_code(exc)
+        if status is not None:
+            return status in RETRYABLE_STATUSES
+
+        return isinstance(exc, (RequestException, ClientError, asyncio.TimeoutError))
+
+    def backoff(self, attempt, exc):
+        """Sleep duration before the next attempt.
+
+        Args:
+            attempt (int): Failed attempt number, from 1.
+            exc (Exception): Request error.
+
+        Returns:
+            float|None: Seconds to wait, None to give up.
+        """
+        retry_after = self.retry_after(exc)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+
+        delay = min((self.backoff_base ** attempt) * (1 + self.error_rate), self.max_backoff)
+        return random.uniform(delay / 2, delay)
+
+    def record_success(self):
+        self.consecutive_failures = 0
+
+    def record_failure(self, exc):
+        self.consecutive_failures += 1
+
+        if self.status_code(exc) in BLOCKED_STATUSES:
+            print("Request blocked (403) - opening circuit.")
+            self.is_open = True
+        elif self.consecutive_failures >= self.failure_threshold:
+            print(f"{self.consecutive_failures} consecutive failed attempts - opening circuit.")
+            self.is_open = True
+
+    async def call(self, func, *args, **kwargs):
+        """Run a request with retries, unless the circuit is open.
+
+        Args:
+            func (callable): Async request function.
+            *args, **kwargs: Arguments for func.
+
+        Returns:
+            Any: Result of func.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+            Exception: Last request error when giving up.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            if self.is_open:
+                raise CircuitOpenError("circuit open, request skipped")
+
+            self.attempts += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self.errors += 1
+                status = self.status_code(e)
+                print(f"Request error (attempt {attempt}, status {status}): {e}")
+                self.record_failure(e)
+
+                if self.is_open or not self.is_retryable(e):
+                    raise
+
+                if attempt == self.max_retries or self.retry_budget <= 0:
+                    print("No retry left for this request.")
+                    raise
+
+                backoff = self.backoff(attempt, e)
+                if backoff is None:
+                    print("Retry-After exceeds max backoff - giving up.")
+                    raise
+
+                self.retry_budget -= 1
+                print(f"Waiting before retry: {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+            else:
+                self.record_success()
+                return result
@@ -0,0 +1,85 @@
+# --- Imports ---
+import resource
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+# --- Functions ---
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    """Peak resident set size.
+
+    Args:
+        who (int): resource.RUSAGE_SELF or resource.RUSAGE_CHILDREN
+            (largest child, e.g. OCR workers).
+
+    Returns:
+        float: Peak RSS in MB (ru_maxrss is in KB on Linux).
+    """
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+# --- Classes ---
+class StageMonitor:
+    """Record peak memory per pipeline stage.
+
+    For each stage: peak Python allocations (tracemalloc, reset at stage
+    start), and process peak RSS at stage end (monotonic, so a stage that
+    raises it is the one that pushed the run closer to the limit).
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled (bool): Track memory, no-op otherwise.
+        """
+        self.enabled = enabled
+        self.stages = []
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """Track a stage.
+
+        Args:
+            name (str): Stage name.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _, py_peak = tracemalloc.get_traced_memory()
+            self.stages.append(
+                {
+                    "stage": name,
+                    "seconds": time.perf_counter() - start,
+                    "python_peak_mb": py_peak / 1024 ** 2,
+                    "rss_peak_mb": peak_rss_mb(),
+                    "rss_growth_mb": peak_rss_mb() - rss_before,
+                }
+            )
+
+    def report(self):
+        """Print the per-stage memory report.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+
+        print("Memory per stage:")
+        for s in self.stages:
+            print(
+                f"  {s['stage']}: {s['seconds']:.1f}s, "
+                f"python peak {s['python_peak_mb']:.1f}MB, "
+                f"peak RSS {s['rss_peak_mb']:.0f}MB (+{s['rss_growth_mb']:.0f}MB)"
+            )
+        print(f"  OCR workers peak RSS: {peak_rss_mb(resource.RUSAGE_CHILDREN):.0f}MB")
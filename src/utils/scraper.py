@@ -1,11 +1,12 @@
 # --- Imports ---
+import asyncio
 from datetime import datetime, timezone
 
 from utils.extract_info import (
     extract_kit_type,
     extract_season,
 )
-from utils.ocr import extract_player_name_ocr
+from utils.kit_catalogue import CATALOGUE
 from domain.request import MY_KITS
 
 
@@ -16,19 +17,85 @@ MY_KITS_SEASON_KITTYPE = [
 
 
 # --- Functions ---
-def filter_and_build_items(items, desired_brands, desired_sizes, saved_ids):
+async def find_player_name(urls_photo, executor, with_colours=False):
+    """Try each photo in turn until a player name is found.
+
+    Args:
+        urls_photo (list): Photo URLs of the item.
+        executor (PipelineExecutor): Executor running the OCR stage.
+        with_colours (bool): Also get the dominant colours of the first photo.
+
+    Returns:
+        tuple: (player name, photo URL, sponsor words read, colours) or
+            (None, None, sponsor words read, colours).
+    """
+    sponsors = []
+    colours = []
+    for i, url_photo in enumerate(urls_photo):
+        player_name, photo_sponsors, photo_colours = await executor.read_photo(
+            url_photo, with_colours=with_colours and i == 0
+        )
+        sponsors += photo_sponsors
+        colours = colours or photo_colours
+        if player_name:
+            return player_name, url_photo, sponsors, colours
+
+    return None, None, sponsors, colours
+
+
+async def identify_item(candidate, urls_photo, executor):
+    """OCR the player name, then fill season/kit type from the kit catalogue.
+
+    Season/kit type from the title decide whether the kit is already owned
+    (skipped before the OCR). When the title leaves them unknown, the
+    brand, the colours of the first photo and the sponsor words read by
+    the OCR are looked up in the catalogue, only to fill the saved item:
+    these guesses never exclude an item.
+
+    Args:
+        candidate (dict): Item fields built from raw_data.
+        urls_photo (list): Photo URLs of the item.
+        executor (PipelineExecutor): Executor running the OCR stage.
+
+    Returns:
+        tuple: (season, kit_type, player name, photo URL), player name and
+            photo URL are None when the kit is owned or no name was found.
+    """
+    season, kit_type = candidate["season"], candidate["kit_type"]
+
+    if (season, kit_type) in MY_KITS_SEASON_KITTYPE:
+        return season, kit_type, None, None
+
+    unresolved = season is None or kit_type is None
+    player_name, url_photo, sponsors, colours = await find_player_name(
+        urls_photo, executor, with_colours=unresolved
+    )
+
+    if player_name and unresolved:
+        season, kit_type = CATALOGUE.resolve(
+            season, kit_type, candidate["brand"], colours, sponsors
+        )
+
+    return season, kit_type, player_name, url_photo
+
+
+async def filter_and_build_items(items, desired_brands, desired_sizes, saved_ids, executor):
     """Filter and build new items from scraped data.
 
+    Title/brand/size filtering runs inline, kit identification and OCR of
+    the matching items are handed off to the executor and run concurrently.
+
     Args:
         items (list): List of scraped item objects.
         desired_brands (set): Set of desired brand names.
         desired_sizes (set): Set of desired size titles.
-        saved_ids (set): Set of already saved item IDs.
+        saved_ids (SeenIndex): Already saved item IDs.
+        executor (PipelineExecutor): Executor running the OCR stage.
 
     Returns:
         list: List of new item dictionaries.
     """
-    new_items = []
+    candidates = []
 
     for item in items:
         data = item.raw_data or {}
@@ -62,23 +129,9 @@ def filter_and_build_items(items, desired_brands, desired_sizes, saved_ids):
             and (size in desired_sizes or size is None)
         )
 
-        player_name = None
-
         if is_match and urls_photo:
-            for url_photo in urls_photo:
-                player_name = extract_player_name_ocr(url_photo)
-                if player_name:
-                    final_url_photo = url_photo
-                    break
-            
-            item_to_add = (
-                player_name is not None and
-                item_id not in saved_ids and
-                (season, kit_type) not in MY_KITS_SEASON_KITTYPE
-            )
-
-            if item_to_add:
-                new_items.append(
+            candidates.append(
+                (
                     {
                         "id": item_id,
                         "title": title,
@@ -87,13 +140,38 @@ def filter_and_build_items(items, desired_brands, desired_sizes, saved_ids):
                         "size": size,
                         "season": season,
                         "kit_type": kit_type,
-                        "player_name": player_name,
                         "url": url_item,
                         "price": price,
-                        "url_photo": final_url_photo,
-                        "date_added": datetime.now(timezone.utc).isoformat()
-                    }
+                    },
+                    urls_photo,
                 )
-                saved_ids.add(item_id)
+            )
+
+    # Identification and OCR stage
+    results = await asyncio.gather(
+        *(identify_item(candidate, urls_photo, executor) for candidate, urls_photo in candidates)
+    )
+
+    new_items = []
+
+    for (candidate, _), (season, kit_type, player_name, final_url_photo) in zip(candidates, results):
+        item_to_add = (
+            player_name is not None and
+            candidate["id"] not in saved_ids and
+            (candidate["season"], candidate["kit_type"]) not in MY_KITS_SEASON_KITTYPE
+        )
+
+        if item_to_add:
+            new_items.append(
+                {
+                    **candidate,
+                    "season": season,
+                    "kit_type": kit_type,
+                    "player_name": player_name,
+                    "url_photo": final_url_photo,
+                    "date_added": datetime.now(timezone.utc).isoformat()
+                }
+            )
+            saved_ids.add(candidate["id"])
 
     return new_items
@@ -0,0 +1,109 @@
+# --- Imports ---
+import base64
+import json
+import pickle
+import time
+from pathlib import Path
+
+
+# --- Classes ---
+class SessionStore:
+    """Vinted session cookies persisted between runs.
+
+    vinted_api_kit loads and saves its cookie jar in cookies_dir, and only
+    bootstraps a new anonymous session (GET on the home page) when no
+    cookies are found, the access token is expired or a request is
+    rejected with 401/403. The store keeps that jar next to vinted.db so
+    the CI cache carries it over, and drops it ahead of time when the
+    token is about to expire so it does not expire mid-run.
+    """
+
+    # vinted_api_kit file name when no proxy / client IP is set
+    COOKIES_FILE = "cookies.pk"
+
+    def __init__(self, cookies_dir, refresh_margin):
+        """
+        Args:
+            cookies_dir (str): Directory of the cookie jar.
+            refresh_margin (int): Seconds before token expiry to refresh.
+        """
+        self.cookies_dir = Path(cookies_dir)
+        self.cookies_dir.mkdir(parents=True, exist_ok=True)
+        self.cookies_path = self.cookies_dir / self.COOKIES_FILE
+        self.refresh_margin = refresh_margin
+
+    def load_access_token(self):
+        """Read the access token from the saved cookie jar.
+
+        Returns:
+            str|None: access_token_web cookie value or None.
+        """
+        if not self.cookies_path.is_file():
+            return None
+
+        try:
+            with self.cookies_path.open("rb") as f:
+                jar = pickle.load(f)
+        except Exception as e:
+            print(f"Failed to read session cookies: {e}")
+            return None
+
+        # jar: {domain: {path: {name: Cookie}}}
+        for paths in jar.values():
+            for cookies in paths.values():
+                cookie = cookies.get("access_token_web")
+                if cookie is not None:
+                    return cookie.value
+
+        return None
+
+    @staticmethod
+    def token_expiry(access_token):
+        """Decode the expiry of a JWT without verifying it.
+
+        Args:
+            access_token (str): JWT.
+
+        Returns:
+            float|None: Expiry timestamp or None.
+        """
+        try:
+            payload = access_token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except Exception:
+            return None
+
+    def prepare(self):
+        """Keep the saved session if still valid, drop it otherwise.
+
+        Returns:
+            bool: True if a warm session is reused.
+        """
+        access_token = self.load_access_token()
+        expiry = self.token_expiry(access_token) if access_token else None
+
+        if expiry and expiry - time.time() > self.refresh_margin:
+            print(f"Reusing saved session (expires in {(expiry - time.time()) / 60:.0f} min)")
+            return True
+
+        if self.cookies_path.exists():
+            print("Saved session expired or expiring, bootstrapping a new one")
+            self.cookies_path.unlink()
+        else:
+            print("No saved session, bootstrapping a new one")
+
+        return False
+
+    def save(self, vinted):
+        """Persist the current cookie jar, with cookies refreshed during the run.
+
+        Args:
+            vinted (VintedApi): Client whose session to save.
+
+        Returns:
+            None
+        """
+        client = getattr(vinted, "_client", None)
+        if client is not None:
+            client.save_cookies()
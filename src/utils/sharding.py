@@ -0,0 +1,75 @@
+# --- Imports ---
+import hashlib
+from bisect import bisect
+
+
+# --- Functions ---
+def hash_key(key):
+    """Stable 64-bit hash, identical across processes and machines.
+
+    Args:
+        key (str): Key to hash.
+
+    Returns:
+        int: Hash value.
+    """
+    return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:8], "big")
+
+
+def parse_shard(value):
+    """Parse a shard spec like "0/4".
+
+    Args:
+        value (str): "index/count".
+
+    Returns:
+        tuple: (shard index, shard count)
+    """
+    index, count = (int(part) for part in value.split("/"))
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {value}, expected index/count with 0 <= index < count")
+    return index, count
+
+
+def shard_queries(queries, shard_index, shard_count):
+    """Queries handled by one shard.
+
+    Args:
+        queries (list): All search texts.
+        shard_index (int): Shard index.
+        shard_count (int): Number of shards.
+
+    Returns:
+        list: Search texts of this shard, in the original order.
+    """
+    ring = HashRing(range(shard_count))
+    return [query for query in queries if ring.node_for(query) == shard_index]
+
+
+# --- Classes ---
+class HashRing:
+    """Consistent hash ring, adding a shard only moves ~1/N of the queries."""
+
+    def __init__(self, nodes, replicas=64):
+        """
+        Args:
+            nodes (iterable): Node identifiers.
+            replicas (int): Virtual nodes per node, to even out the load.
+        """
+        points = sorted(
+            (hash_key(f"{node}#{i}"), node) for node in nodes for i in range(replicas)
+        )
+        self.hashes = [h for h, _ in points]
+        self.nodes = [node for _, node in points]
+
+    def node_for(self, key):
+        """Node owning a key.
+
+        Args:
+            key (str): Key, e.g. a search text.
+
+        Returns:
+            Any: Node identifier.
+        """
+        idx = bisect(self.hashes, hash_key(key)) % len(self.hashes)
+        return self.nodes[idx]
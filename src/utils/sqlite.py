@@ -9,18 +9,21 @@ from domain.request import SAVED_ITEMS_DB
 # --- Functions ---
 
 # Get connection
-def get_connection():
+def get_connection(db_path=SAVED_ITEMS_DB):
     """Get a SQLite connection."""
-    return sqlite3.connect(SAVED_ITEMS_DB)
+    return sqlite3.connect(db_path)
 
 # Create
-def create_table():
+def create_table(db_path=SAVED_ITEMS_DB):
     """Create the saved_items table if it does not exist.
     
+    Args:
+        db_path (str): Database path.
+
     Returns:
         None
     """
-    conn = get_connection()
+    conn = get_connection(db_path)
     cursor = conn.cursor()
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS saved_items (
@@ -42,16 +45,17 @@ def create_table():
     conn.commit()
 
 # Insert
-def insert_into_sqlite(item):
+def insert_into_sqlite(item, db_path=SAVED_ITEMS_DB):
     """Insert an item into the SQLite database.
     
     Args:
         item (dict): The item dictionary to insert.
+        db_path (str): Database path.
     
     Returns:
         None
     """
-    conn = get_connection()
+    conn = get_connection(db_path)
     cursor = conn.cursor()
     cursor.execute("""
     INSERT OR IGNORE INTO saved_items (
@@ -92,6 +96,25 @@ def get_all_items():
     all_items = [dict(zip(columns, row)) for row in data]
     return all_items
 
+# Get all item ids
+def get_all_item_ids(db_path=SAVED_ITEMS_DB):
+    """Stream the IDs of all saved items.
+
+    Args:
+        db_path (str): Database path.
+
+    Yields:
+        str: Item ID.
+    """
+    conn = get_connection(db_path)
+    cursor = conn.cursor()
+    cursor.execute("""
+    SELECT id
+    FROM saved_items
+    """)
+    for (item_id,) in cursor:
+        yield item_id
+
 # Get unsent items
 def get_unsent_items():
     """Retrieve all items that have not been marked as email sent.
@@ -128,6 +151,38 @@ def mark_email_sent():
     """)
     conn.commit()
 
+# Merge shards
+def merge_databases(shard_paths, db_path=SAVED_ITEMS_DB):
+    """Merge shard databases into the central one, deduplicating on id.
+
+    Args:
+        shard_paths (list): Shard database paths.
+        db_path (str): Central database path.
+
+    Returns:
+        int: Number of new items merged.
+    """
+    create_table(db_path)
+    conn = get_connection(db_path)
+    cursor = conn.cursor()
+    merged = 0
+    for shard_path in shard_paths:
+        cursor.execute("ATTACH DATABASE ? AS shard", (str(shard_path),))
+        cursor.execute("""
+        INSERT OR IGNORE INTO saved_items (
+            id, title, brand, status, size, season, kit_type,
+            player_name, url, price, url_photo, date_added
+        )
+        SELECT
+            id, title, brand, status, size, season, kit_type,
+            player_name, url, price, url_photo, date_added
+        FROM shard.saved_items
+        """)
+        merged += cursor.rowcount
+        conn.commit()
+        cursor.execute("DETACH DATABASE shard")
+    return merged
+
 
 # --- Main Execution ---
 
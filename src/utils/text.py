@@ -25,13 +25,14 @@ def normalize_season(match):
         end = groups[2]
 
         if len(end) == 2:
-            end = start[:2] + end  # 23 -> 2023 → 2024
+            end = str(int(start) + 1)[:2] + end  # 2023-24 → 2024, 1999-00 → 2000
 
         return f"{start}-{end}"
 
     if groups[3] and groups[4]:
-        start = "20" + groups[3]
-        end = "20" + groups[4]
+        century = "19" if int(groups[3]) >= 50 else "20"  # 94/95 → 1994, 23/24 → 2023
+        start = century + groups[3]
+        end = str(int(start) + 1)[:2] + groups[4]
         return f"{start}-{end}"
 
     return None